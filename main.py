@@ -1,31 +1,43 @@
 """
 AURA - Elderly Care Voice Assistant (single-file)
 Requirements:
-  pip install customtkinter pyttsx3 SpeechRecognition wikipedia requests openai pygame pillow
+  pip install customtkinter pyttsx3 SpeechRecognition wikipedia requests "openai>=1.0" pygame pillow
+  Optional: pip install faster-whisper  (offline speech recognition; Google is used otherwise)
+  Optional: pip install orjson  (faster config / API JSON handling)
+  Optional: pip install "httpx[http2]"  (HTTP/2 for the OpenAI client)
 Notes:
   - Ensure microphone is available for speech recognition.
   - Provide OpenWeatherMap and (optionally) NewsAPI / OpenAI keys in Settings to enable those features.
 """
 
+import io
 import os
+import re
 import sys
 import json
 import time
 import queue
 import threading
-import datetime
+import functools
+import heapq
 import random
 import webbrowser
+from collections import deque
+from urllib.parse import urlsplit
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used otherwise
+    orjson = None
+
 import customtkinter as ctk
-from tkinter import filedialog, messagebox
-import pyttsx3
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
 import speech_recognition as sr
 import requests
-import wikipedia
-import openai
-from pygame import mixer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # -------------------------
 # CONFIG / DEFAULTS
@@ -51,9 +63,84 @@ DEFAULT_CONFIG = {
     "medication_schedule": {}     # {"MedName": ["08:00","20:00"], ...}
 }
 
+# fallbacks used when a Settings field is left empty
+_DEF_NAME, _DEF_CITY, _DEF_THEME = DEFAULT_CONFIG["user_name"], DEFAULT_CONFIG["city"], DEFAULT_CONFIG["theme"]
+
 WEATHER_URL = "http://api.openweathermap.org/data/2.5/weather"
 NEWS_URL = "https://newsapi.org/v2/top-headlines"
 
+# response cache lifetimes (seconds); jitter keeps entries from expiring together
+WEATHER_TTL = 600
+NEWS_TTL = 900
+CACHE_JITTER = 30
+
+# how often the mic noise threshold is re-measured while listening (seconds)
+RECALIBRATE_SECS = 300
+
+# favorites are decoded to PCM up front while they fit in the budget (decoded bytes, all files);
+# files larger than the per-file cap (on disk) are always streamed with mixer.music
+SOUND_CACHE_MAX_BYTES = 4 * 1024 * 1024
+SOUND_CACHE_BUDGET_BYTES = 64 * 1024 * 1024
+
+# spoken time/date formats
+TIME_FMT = "%I:%M %p"
+DATE_FMT = "%A, %B %d, %Y"
+
+# command routing: one pass over the utterance finds every intent keyword;
+# INTENT_PRIORITY decides which one wins when several are present;
+# nouns accept plural forms ("my pills", "tell me some jokes"); "open" needs a URL-like
+# target, since a sentence-ending period (Whisper punctuates) is not one
+INTENT_RE = re.compile(
+    r"\b(?:(?P<emergency>help|emergency|accidents?|fall(?:s|en)?|ambulance)"
+    r"|(?P<time>time)"
+    r"|(?P<date>date)"
+    r"|(?P<weather>weather)"
+    r"|(?P<news>news)"
+    r"|(?P<joke>jokes?)"
+    r"|(?P<music>play music|play songs?)"
+    r"|(?P<reminder>remind me|reminders?)"
+    r"|(?P<med>medications?|pills?|medicines?)"
+    r"|(?P<open>open(?=.*(?:https?://|www\.|\S\.[a-z]{2,}|website)))"
+    r"|(?P<exit>exit|quit|goodbye))\b",
+    re.I,
+)
+INTENT_PRIORITY = ("emergency", "time", "date", "weather", "news", "joke",
+                   "music", "reminder", "med", "open", "exit")
+
+JOKES = (
+    "Why don't scientists trust atoms? Because they make up everything.",
+    "I told my wife she drew her eyebrows too high. She looked surprised.",
+    "What do you call a fake noodle? An impasta!",
+)
+
+# "remind me to <task> [at HH:MM]"; text after the last " at " that isn't HH:MM is kept in `at`;
+# a closing . ! or ? (Whisper punctuates its transcripts) is ignored
+REMIND_RE = re.compile(
+    r"remind me to\s+(?P<task>.+?)"
+    r"(?:\s+at\s+(?:(?P<h>\d{1,2}):(?P<m>\d{2})|(?P<at>(?:(?!\sat\s).)+?)))?[.!?]?\s*$",
+    re.I,
+)
+
+# a valid HH:MM (24h) medication time; each comma-separated entry must match in full
+TIMES_RE = re.compile(r"\b(?:[01]?\d|2[0-3]):[0-5]\d\b")
+
+# conversation box prefixes per message tag
+TAG_PREFIXES = {"user": "You: ", "assistant": "AURA: ", "system": "System: ", "emergency": "!!! EMERGENCY: "}
+
+# where streamed AI text is cut into speakable sentences
+SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+# fallback poll interval for the GUI queue (ms)
+GUI_WATCHDOG_MS = 1000
+
+# -------------------------
+# UTILS: JSON
+# -------------------------
+def json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # -------------------------
 # UTILS: Config Manager
 # -------------------------
@@ -61,12 +148,17 @@ class ConfigManager:
     def __init__(self, path: str = CONFIG_FILE):
         self.path = path
         self.data = self._load()
+        # resolved dotted-key lookups; invalidated by set()/update()
+        self._cache: Dict[str, object] = {}
+        # worker threads read while the GUI thread writes: a miss must not store a
+        # value that a concurrent set()/update() has already invalidated
+        self._lock = threading.Lock()
 
     def _load(self) -> Dict:
         if os.path.exists(self.path):
             try:
-                with open(self.path, "r", encoding="utf-8") as f:
-                    loaded = json.load(f)
+                with open(self.path, "rb") as f:
+                    loaded = json_loads(f.read())
                     # merge defaults (shallow)
                     merged = DEFAULT_CONFIG.copy()
                     merged.update(loaded)
@@ -89,44 +181,129 @@ class ConfigManager:
 
     def save(self) -> bool:
         try:
-            with open(self.path, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, indent=4)
+            if orjson is not None:
+                with open(self.path, "wb") as f:
+                    f.write(orjson.dumps(self.data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(self.data, f, indent=2)
             return True
         except Exception as e:
             print(f"[Config] Error saving config: {e}")
             return False
 
     def get(self, key_path: str, default=None):
+        try:
+            return self._cache[key_path]
+        except KeyError:
+            pass
         parts = key_path.split(".")
-        cur = self.data
-        for p in parts:
-            if isinstance(cur, dict) and p in cur:
-                cur = cur[p]
-            else:
-                return default
+        with self._lock:
+            cur = self.data
+            for p in parts:
+                if isinstance(cur, dict) and p in cur:
+                    cur = cur[p]
+                else:
+                    return default
+            self._cache[key_path] = cur
         return cur
 
+    def update(self, mapping: Dict):
+        """Replace several top-level keys at once (no dotted-path parsing)."""
+        with self._lock:
+            self.data.update(mapping)
+            self._cache.clear()
+
+    def _invalidate(self, key_path: str):
+        # drop the key itself, its parents and its children; caller holds _lock
+        for k in list(self._cache):
+            if k == key_path or key_path.startswith(k + ".") or k.startswith(key_path + "."):
+                self._cache.pop(k, None)
+
     def set(self, key_path: str, value):
         parts = key_path.split(".")
-        cur = self.data
-        for p in parts[:-1]:
-            if p not in cur or not isinstance(cur[p], dict):
-                cur[p] = {}
-            cur = cur[p]
-        cur[parts[-1]] = value
+        with self._lock:
+            self._invalidate(key_path)
+            cur = self.data
+            for p in parts[:-1]:
+                if p not in cur or not isinstance(cur[p], dict):
+                    cur[p] = {}
+                cur = cur[p]
+            cur[parts[-1]] = value
 
 # -------------------------
-# CORE: TTS and Mixer init
+# UTILS: time math
 # -------------------------
-# initialize pygame mixer for music
-try:
-    mixer.init()
-except Exception as e:
-    print(f"[Audio] mixer.init() failed: {e}")
+def seconds_until(hh: int, mm: int, now: Optional[time.struct_time] = None) -> int:
+    """Seconds from `now` until the next HH:MM; an exact match counts as tomorrow."""
+    if now is None:
+        now = time.localtime()
+    now_sec = now.tm_hour * 3600 + now.tm_min * 60 + now.tm_sec
+    delta = (hh * 3600 + mm * 60 - now_sec) % 86400
+    return delta or 86400
 
-tts_engine = pyttsx3.init()
-# keep reference to voices if needed
-voices = tts_engine.getProperty("voices")
+# -------------------------
+# UTILS: Wikipedia
+# -------------------------
+@functools.lru_cache(maxsize=256)
+def wiki_summary(query: str) -> str:
+    """Short Wikipedia summary; only successful lookups are cached (exceptions are not)."""
+    import wikipedia
+    return wikipedia.summary(query, sentences=2, auto_suggest=False)
+
+# -------------------------
+# UTILS: GUI queue
+# -------------------------
+class NotifyingDeque(deque):
+    """Single-consumer GUI queue: append/popleft are atomic in CPython, and every append
+    calls `notify` so the consumer can be woken on demand."""
+    def __init__(self, notify):
+        super().__init__()
+        self._notify = notify
+
+    def append(self, item):
+        super().append(item)
+        try:
+            self._notify()
+        except Exception:
+            # window not ready / already destroyed; the watchdog will pick it up
+            pass
+
+# -------------------------
+# CORE: TTS and Mixer init
+# -------------------------
+# Both are created on first use: pyttsx3.init() and mixer.init() are slow
+# and would otherwise delay the first window paint.
+tts_engine = None
+voices = []
+mixer = None
+# separate locks: a slow speech driver start must not hold up the mixer (or the GUI thread)
+_tts_init_lock = threading.Lock()
+_mixer_init_lock = threading.Lock()
+# tells the TTS worker to exit; a private object so no speak() argument can match it
+_TTS_STOP = object()
+
+def get_tts_engine():
+    global tts_engine, voices
+    with _tts_init_lock:
+        if tts_engine is None:
+            import pyttsx3
+            tts_engine = pyttsx3.init()
+            # keep reference to voices if needed
+            voices = tts_engine.getProperty("voices")
+    return tts_engine
+
+def get_mixer():
+    global mixer
+    with _mixer_init_lock:
+        if mixer is None:
+            from pygame import mixer as _mixer
+            try:
+                _mixer.init()
+            except Exception as e:
+                print(f"[Audio] mixer.init() failed: {e}")
+            mixer = _mixer
+    return mixer
 
 # -------------------------
 # APP: Main Window
@@ -153,15 +330,60 @@ class AURAApp(ctk.CTk):
         # apply voice settings
         self.apply_tts_settings()
 
-        # GUI update queue (thread-safe)
-        self.gui_queue: queue.Queue = queue.Queue()
-        self.after(100, self._process_gui_queue)
+        # GUI update queue (thread-safe); every put wakes the main loop via a virtual event
+        self.gui_queue: deque = NotifyingDeque(lambda: self.event_generate("<<GuiUpdate>>", when="tail"))
+        self.bind("<<GuiUpdate>>", lambda e: self._drain_gui_queue())
+        self._chunk_open = False  # a streamed message is being written
+        self.after(GUI_WATCHDOG_MS, self._gui_queue_watchdog)
+
+        # speech output: one worker owns the (non-reentrant) TTS engine; _TTS_STOP stops it
+        self._tts_q: queue.Queue = queue.Queue()
+        threading.Thread(target=self._tts_worker, daemon=True).start()
 
         # listening flag
         self.listening_event = threading.Event()
-
-        # medication reminders tracking (store after ids to cancel if needed)
-        self._med_after_ids: List[int] = []
+        # recorded utterances waiting for recognition (None stops the recognizer)
+        self._audio_q: queue.Queue = queue.Queue(maxsize=4)
+        # local speech model (faster-whisper), loaded on first use
+        self._asr = None
+        self._asr_failed = False
+
+        # shared HTTP session (keep-alive + connection pooling)
+        self.http = requests.Session()
+        self.http.headers["User-Agent"] = "AURA/1.0"
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]))
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+
+        # OpenAI client (created on first use, recreated when the key changes)
+        self._oa = None
+        self._oa_key = ""
+        self._oa_lock = threading.Lock()
+
+        # API response caches: key -> (expires_at, text)
+        self._weather_cache: Dict[str, tuple] = {}
+        self._news_cache: Dict[str, tuple] = {}
+        self._cache_lock = threading.Lock()
+
+        # medication reminders: min-heap of (due_epoch, med, "HH:MM") driven by a single after() timer
+        self._med_heap: List[tuple] = []
+        self._next_med_after_id: Optional[str] = None
+
+        # command intent -> handler (see INTENT_RE)
+        self._intent_handlers = {
+            "emergency": self._handle_emergency,
+            "time": self._handle_time,
+            "date": self._handle_date,
+            "weather": self._handle_weather,
+            "news": self._handle_news,
+            "joke": self._handle_joke,
+            "music": self._handle_music,
+            "reminder": self._handle_reminder,
+            "med": self._handle_med,
+            "open": self._handle_open,
+            "exit": self._handle_exit,
+        }
 
         # build UI
         self._build_ui()
@@ -169,14 +391,13 @@ class AURAApp(ctk.CTk):
         # schedule medication reminders
         self._schedule_medication_reminders()
 
+        # decode favorite music in the background so "play music" starts instantly
+        self._sound_cache: Dict[str, object] = {}
+        self._start_music_preload()
+
         # greeting
         self._greet_user()
 
-        # ensure OpenAI key present in library object if present in config
-        openai_key = self.config_mgr.get("api_keys.openai", "")
-        if openai_key:
-            openai.api_key = openai_key
-
     # -------------------------
     # UI BUILDING
     # -------------------------
@@ -250,15 +471,34 @@ class AURAApp(ctk.CTk):
     # -------------------------
     # GUI queue processing
     # -------------------------
-    def _process_gui_queue(self):
+    def _gui_queue_watchdog(self):
+        # safety net only: normal updates are delivered by <<GuiUpdate>>
+        self._drain_gui_queue()
+        self.after(GUI_WATCHDOG_MS, self._gui_queue_watchdog)
+
+    def _drain_gui_queue(self):
+        # text items are joined into one textbox insert per drain; other items run afterwards
+        buffered: List[str] = []
+        others = []
         try:
-            while not self.gui_queue.empty():
-                item = self.gui_queue.get_nowait()
+            while self.gui_queue:
+                item = self.gui_queue.popleft()
                 action = item[0]
                 if action == "append":
                     tag, text = item[1], item[2]
-                    self._append_text(tag, text)
-                elif action == "status":
+                    buffered.append(self._format_text(tag, text))
+                elif action == "append_chunk":
+                    tag, text = item[1], item[2]
+                    buffered.append(self._format_chunk(tag, text))
+                elif action == "append_end":
+                    buffered.append(self._format_end())
+                else:
+                    others.append(item)
+            if buffered:
+                self._insert_text("".join(buffered))
+            for item in others:
+                action = item[0]
+                if action == "status":
                     self.status_var.set(item[1])
                 elif action == "button":
                     btn, text = item[1], item[2]
@@ -269,29 +509,36 @@ class AURAApp(ctk.CTk):
                     messagebox.showinfo("Info", item[1], parent=self)
         except Exception as e:
             print(f"[GUI Queue] process error: {e}")
-        finally:
-            self.after(100, self._process_gui_queue)
 
-    def _append_text(self, tag: str, text: str):
+    def _insert_text(self, text: str):
         self.textbox.configure(state="normal")
-        if tag == "user":
-            self.textbox.insert("end", f"You: {text}\n\n")
-        elif tag == "assistant":
-            self.textbox.insert("end", f"AURA: {text}\n\n")
-        elif tag == "system":
-            self.textbox.insert("end", f"System: {text}\n\n")
-        elif tag == "emergency":
-            self.textbox.insert("end", f"!!! EMERGENCY: {text}\n\n")
-        else:
-            self.textbox.insert("end", f"{text}\n\n")
+        self.textbox.insert("end", text)
         self.textbox.configure(state="disabled")
         self.textbox.see("end")
 
+    def _format_text(self, tag: str, text: str) -> str:
+        # a whole message ends any streamed one in progress; the rest of the stream
+        # continues below it under a fresh prefix
+        return f"{self._format_end()}{TAG_PREFIXES.get(tag, '')}{text}\n\n"
+
+    def _format_chunk(self, tag: str, text: str) -> str:
+        # streamed message: prefix once, then raw fragments until "append_end"
+        if not self._chunk_open:
+            text = TAG_PREFIXES.get(tag, "") + text.lstrip()
+            self._chunk_open = True
+        return text
+
+    def _format_end(self) -> str:
+        if self._chunk_open:
+            self._chunk_open = False
+            return "\n\n"
+        return ""
+
     # -------------------------
     # Greeting
     # -------------------------
     def _greet_user(self):
-        hour = datetime.datetime.now().hour
+        hour = time.localtime().tm_hour
         if 5 <= hour < 12:
             part = "Good morning"
         elif 12 <= hour < 18:
@@ -300,13 +547,21 @@ class AURAApp(ctk.CTk):
             part = "Good evening"
         name = self.config.get("user_name", "User")
         greeting = f"{part}, {name}. I'm AURA — how can I help you today?"
-        self.gui_queue.put(("append", "assistant", greeting))
+        self.gui_queue.append(("append", "assistant", greeting))
         self.speak(greeting)
 
     # -------------------------
     # TTS helpers
     # -------------------------
+    def _tts(self):
+        if tts_engine is None:
+            get_tts_engine()
+            self.apply_tts_settings()
+        return tts_engine
+
     def apply_tts_settings(self):
+        if tts_engine is None:
+            return  # applied when the engine is first created (see _tts)
         rate = int(self.config.get("voice_rate", 150))
         vol = float(self.config.get("voice_volume", 1.0)) if "voice_volume" in self.config else 1.0
         try:
@@ -319,21 +574,38 @@ class AURAApp(ctk.CTk):
         except Exception as e:
             print(f"[TTS] Could not apply settings: {e}")
 
-    def speak(self, text: str, interrupt=False):
-        # uses a background thread to avoid blocking
-        def _speak():
+    def _tts_worker(self):
+        # bring the speech driver up now, off the GUI thread, so the first reply isn't delayed by it;
+        # anything spoken meanwhile simply waits in _tts_q
+        try:
+            self._tts()
+        except Exception as e:
+            print(f"[TTS] engine init failed: {e}")
+        while True:
+            text = self._tts_q.get()
+            if text is _TTS_STOP:
+                return
             try:
-                if interrupt:
-                    try:
-                        tts_engine.stop()
-                    except Exception:
-                        pass
-                tts_engine.say(text)
-                tts_engine.runAndWait()
+                engine = self._tts()
+                engine.say(text)
+                engine.runAndWait()
             except Exception as e:
                 print(f"[TTS] speak error: {e}")
-                self.gui_queue.put(("append", "system", f"Speech error: {e}"))
-        threading.Thread(target=_speak, daemon=True).start()
+                self.gui_queue.append(("append", "system", f"Speech error: {e}"))
+
+    def speak(self, text: str, interrupt=False):
+        # queued for the TTS worker to avoid blocking; interrupt drops anything pending
+        if not text:
+            return
+        if interrupt:
+            with self._tts_q.mutex:
+                self._tts_q.queue.clear()
+            if tts_engine is not None:
+                try:
+                    tts_engine.stop()
+                except Exception:
+                    pass
+        self._tts_q.put(text)
 
     # -------------------------
     # Listening (speech -> text)
@@ -341,45 +613,101 @@ class AURAApp(ctk.CTk):
     def toggle_listening(self):
         if self.listening_event.is_set():
             self.listening_event.clear()
-            self.gui_queue.put(("button", self.listen_button, "🎤 Start Listening"))
-            self.gui_queue.put(("status", "Ready"))
+            self.gui_queue.append(("button", self.listen_button, "🎤 Start Listening"))
+            self.gui_queue.append(("status", "Ready"))
         else:
             self.listening_event.set()
-            self.gui_queue.put(("button", self.listen_button, "🔴 Listening..."))
-            self.gui_queue.put(("status", "Listening..."))
-            threading.Thread(target=self._listen_loop, daemon=True).start()
+            self.gui_queue.append(("button", self.listen_button, "🔴 Listening..."))
+            self.gui_queue.append(("status", "Listening..."))
+            threading.Thread(target=self._capture_loop, daemon=True).start()
+            threading.Thread(target=self._recognize_loop, daemon=True).start()
 
-    def _listen_loop(self):
+    def _capture_loop(self):
+        """Only records utterances; recognition happens on _recognize_loop so the mic is never idle."""
         recognizer = sr.Recognizer()
-        mic = None
         try:
             with sr.Microphone() as source:
+                recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                last_cal = time.monotonic()
+                self.gui_queue.append(("status", "Listening..."))
                 while self.listening_event.is_set():
-                    self.gui_queue.put(("status", "Listening..."))
-                    recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                    # recalibrate occasionally rather than before every utterance
+                    if time.monotonic() - last_cal > RECALIBRATE_SECS:
+                        recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                        last_cal = time.monotonic()
                     try:
                         audio = recognizer.listen(source, timeout=5, phrase_time_limit=10)
                     except sr.WaitTimeoutError:
                         continue
-                    self.gui_queue.put(("status", "Recognizing..."))
                     try:
-                        text = recognizer.recognize_google(audio, language="en-IN")
-                        if text:
-                            self.gui_queue.put(("append", "user", text))
-                            # handle command in background
-                            threading.Thread(target=self._do_command, args=(text,), daemon=True).start()
-                    except sr.UnknownValueError:
-                        self.gui_queue.put(("append", "system", "Could not understand audio."))
-                    except sr.RequestError as e:
-                        self.gui_queue.put(("append", "system", f"Speech service error: {e}"))
-                        self.listening_event.clear()
-                        break
+                        self._audio_q.put(audio, block=False)
+                    except queue.Full:
+                        # recognizer is behind; drop rather than fall further out of real time
+                        print("[Listen] audio queue full, dropping utterance")
         except Exception as e:
-            self.gui_queue.put(("error_popup", f"Microphone error: {e}"))
+            self.gui_queue.append(("error_popup", f"Microphone error: {e}"))
         finally:
             self.listening_event.clear()
-            self.gui_queue.put(("button", self.listen_button, "🎤 Start Listening"))
-            self.gui_queue.put(("status", "Ready"))
+            # stop the recognizer thread; never block here, it may already be gone
+            try:
+                self._audio_q.put_nowait(None)
+            except queue.Full:
+                with self._audio_q.mutex:
+                    self._audio_q.queue.clear()
+                self._audio_q.put_nowait(None)
+            self.gui_queue.append(("button", self.listen_button, "🎤 Start Listening"))
+            self.gui_queue.append(("status", "Ready"))
+
+    def _recognize_loop(self):
+        recognizer = sr.Recognizer()
+        while True:
+            audio = self._audio_q.get()
+            if audio is None:
+                return
+            self.gui_queue.append(("status", "Recognizing..."))
+            try:
+                text = self._transcribe(recognizer, audio)
+                if text:
+                    self.gui_queue.append(("append", "user", text))
+                    # handle command in background
+                    threading.Thread(target=self._do_command, args=(text,), daemon=True).start()
+            except sr.UnknownValueError:
+                self.gui_queue.append(("append", "system", "Could not understand audio."))
+            except sr.RequestError as e:
+                self.gui_queue.append(("append", "system", f"Speech service error: {e}"))
+                self.listening_event.clear()
+            except Exception as e:
+                # e.g. OSError when the flac binary is missing; stop capture rather than die silently
+                self.gui_queue.append(("error_popup", f"Microphone error: {e}"))
+                self.listening_event.clear()
+            if self.listening_event.is_set():
+                self.gui_queue.append(("status", "Listening..."))
+
+    def _load_local_asr(self):
+        if self._asr is None and not self._asr_failed:
+            try:
+                from faster_whisper import WhisperModel
+                self._asr = WhisperModel("tiny.en", device="cpu", compute_type="int8")
+            except Exception as e:
+                print(f"[ASR] local model unavailable, using Google: {e}")
+                self._asr_failed = True
+        return self._asr
+
+    def _transcribe(self, recognizer: sr.Recognizer, audio) -> str:
+        """Local Whisper first (offline, no HTTP round-trip); Google Web Speech as fallback."""
+        model = self._load_local_asr()
+        if model is not None:
+            try:
+                segments, _info = model.transcribe(io.BytesIO(audio.get_wav_data()), beam_size=1, vad_filter=True)
+                text = " ".join(seg.text.strip() for seg in segments).strip()
+                if not text:
+                    raise sr.UnknownValueError()
+                return text
+            except sr.UnknownValueError:
+                raise
+            except Exception as e:
+                print(f"[ASR] local transcription failed, using Google: {e}")
+        return recognizer.recognize_google(audio, language="en-IN")
 
     # -------------------------
     # Commands / Actions
@@ -389,155 +717,211 @@ class AURAApp(ctk.CTk):
         if not text:
             return
         self.entry.delete(0, "end")
-        self.gui_queue.put(("append", "user", text))
+        self.gui_queue.append(("append", "user", text))
         threading.Thread(target=self._do_command, args=(text,), daemon=True).start()
 
+    def _match_intent(self, cmd: str) -> Optional[str]:
+        found = {m.lastgroup for m in INTENT_RE.finditer(cmd)}
+        for intent in INTENT_PRIORITY:
+            if intent in found:
+                return intent
+        return None
+
+    def _handle_emergency(self, cmd: str):
+        self.gui_queue.append(("append", "assistant", "Triggering emergency protocol."))
+        self.emergency_protocol()
+
+    def _handle_time(self, cmd: str):
+        now = time.strftime(TIME_FMT)
+        resp = f"The time is {now}."
+        self.gui_queue.append(("append", "assistant", resp))
+        self.speak(resp)
+
+    def _handle_date(self, cmd: str):
+        today = time.strftime(DATE_FMT)
+        resp = f"Today is {today}."
+        self.gui_queue.append(("append", "assistant", resp))
+        self.speak(resp)
+
+    def _handle_weather(self, cmd: str):
+        resp = self.get_weather()
+        self.gui_queue.append(("append", "assistant", resp))
+        self.speak(resp)
+
+    def _handle_news(self, cmd: str):
+        resp = self.get_news()
+        self.gui_queue.append(("append", "assistant", resp))
+        self.speak("Here are the top headlines.")
+
+    def _handle_joke(self, cmd: str):
+        resp = self.get_joke()
+        self.gui_queue.append(("append", "assistant", resp))
+        self.speak(resp)
+
+    def _handle_music(self, cmd: str):
+        self.play_music_from_favorites()
+        self.gui_queue.append(("append", "assistant", "Playing music from favorites."))
+
+    def _handle_reminder(self, cmd: str):
+        resp = self.add_reminder(cmd)
+        self.gui_queue.append(("append", "assistant", resp))
+        self.speak(resp)
+
+    def _handle_med(self, cmd: str):
+        resp = self.show_medication_schedule()
+        if resp is None:
+            return  # nothing scheduled; show_medication_schedule already said so
+        self.gui_queue.append(("append", "assistant", resp))
+        self.speak(resp)
+
+    def _handle_open(self, cmd: str):
+        # crude open command: everything after "open", minus the word "website"
+        start = cmd.lower().find("open") + len("open")
+        target = cmd[start:].replace("website", "").strip().rstrip(".!?")
+        if urlsplit(target).scheme not in ("http", "https"):
+            target = "https://" + target
+        webbrowser.open(target)
+        self.gui_queue.append(("append", "assistant", f"Opening {target}"))
+
+    def _handle_exit(self, cmd: str):
+        self.gui_queue.append(("append", "assistant", "Goodbye!"))
+        self.speak("Goodbye!")
+        self.after(800, self.on_close)
+
     def _do_command(self, command: str):
         """Main router for text commands. Non-blocking (run in background threads)."""
         try:
-            cmd = command.lower().strip()
-
-            # Emergency keywords
-            if any(k in cmd for k in ("help", "emergency", "accident", "fall", "ambulance")):
-                self.gui_queue.put(("append", "assistant", "Triggering emergency protocol."))
-                self.emergency_protocol()
-                return
-
-            if "time" in cmd:
-                now = datetime.datetime.now().strftime("%I:%M %p")
-                resp = f"The time is {now}."
-                self.gui_queue.put(("append", "assistant", resp))
-                self.speak(resp)
-                return
-
-            if "date" in cmd:
-                today = datetime.datetime.now().strftime("%A, %B %d, %Y")
-                resp = f"Today is {today}."
-                self.gui_queue.put(("append", "assistant", resp))
-                self.speak(resp)
-                return
-
-            if "weather" in cmd:
-                resp = self.get_weather()
-                self.gui_queue.put(("append", "assistant", resp))
-                self.speak(resp)
-                return
-
-            if "news" in cmd:
-                resp = self.get_news()
-                self.gui_queue.put(("append", "assistant", resp))
-                self.speak("Here are the top headlines.")
-                return
-
-            if "joke" in cmd:
-                resp = self.get_joke()
-                self.gui_queue.put(("append", "assistant", resp))
-                self.speak(resp)
-                return
-
-            if "play music" in cmd or "play song" in cmd:
-                self.play_music_from_favorites()
-                self.gui_queue.put(("append", "assistant", "Playing music from favorites."))
-                return
-
-            if "remind me" in cmd or "reminder" in cmd:
-                resp = self.add_reminder(cmd)
-                self.gui_queue.put(("append", "assistant", resp))
-                self.speak(resp)
-                return
-
-            if "medication" in cmd or "pill" in cmd or "medicine" in cmd:
-                resp = self.show_medication_schedule()
-                self.gui_queue.put(("append", "assistant", resp))
-                self.speak(resp)
-                return
-
-            if "open" in cmd and ("http" in cmd or "." in cmd or "website" in cmd):
-                # crude open command
-                target = command.replace("open", "").strip()
-                if not target.startswith("http"):
-                    if "website" in target:
-                        target = target.replace("website", "").strip()
-                    if not target.startswith("http"):
-                        target = "https://" + target
-                webbrowser.open(target)
-                self.gui_queue.put(("append", "assistant", f"Opening {target}"))
-                return
-
-            if any(w in cmd for w in ("exit", "quit", "goodbye")):
-                self.gui_queue.put(("append", "assistant", "Goodbye!"))
-                self.speak("Goodbye!")
-                self.after(800, self.on_close)
+            cmd = command.strip()
+            intent = self._match_intent(cmd)
+            if intent is not None:
+                self._intent_handlers[intent](cmd)
                 return
 
             # no simple match — try OpenAI if configured
             openai_key = self.config_mgr.get("api_keys.openai", "")
             if openai_key:
                 try:
-                    openai.api_key = openai_key
-                    # call ChatCompletion
-                    resp_text = self.get_ai_response(command)
-                    self.gui_queue.put(("append", "assistant", resp_text))
-                    self.speak(resp_text)
-                    return
+                    # streams the reply to the conversation box and TTS as it arrives
+                    if self.get_ai_response(command):
+                        return
                 except Exception as e:
                     # fall through to wikipedia
                     print(f"[AI] error: {e}")
 
             # fallback to wikipedia short summary
             try:
-                wiki_resp = wikipedia.summary(command, sentences=2, auto_suggest=False)
-                self.gui_queue.put(("append", "assistant", wiki_resp))
+                wiki_resp = wiki_summary(" ".join(command.split()))
+                self.gui_queue.append(("append", "assistant", wiki_resp))
                 self.speak(wiki_resp)
                 return
             except Exception as e:
                 # final fallback
-                self.gui_queue.put(("append", "assistant", "Sorry, I couldn't find an answer."))
+                self.gui_queue.append(("append", "assistant", "Sorry, I couldn't find an answer."))
                 self.speak("Sorry, I couldn't find an answer to that.")
                 return
 
         except Exception as e:
-            self.gui_queue.put(("append", "assistant", f"An error occurred: {e}"))
+            self.gui_queue.append(("append", "assistant", f"An error occurred: {e}"))
             print(f"[Command] error: {e}")
 
     # -------------------------
     # OpenAI helper
     # -------------------------
+    def _openai_client(self, api_key: str):
+        with self._oa_lock:
+            if self._oa is None or api_key != self._oa_key:
+                import httpx
+                from openai import OpenAI
+                if self._oa is not None:
+                    self._oa.close()
+                limits = httpx.Limits(max_keepalive_connections=4)
+                try:
+                    http_client = httpx.Client(http2=True, timeout=15, limits=limits)
+                except ImportError:
+                    # h2 not installed; keep-alive over HTTP/1.1 still avoids repeat handshakes
+                    http_client = httpx.Client(timeout=15, limits=limits)
+                self._oa = OpenAI(api_key=api_key, http_client=http_client)
+                self._oa_key = api_key
+            return self._oa
+
     def get_ai_response(self, prompt: str) -> str:
-        # Simple ChatCompletion usage
+        """Stream a chat completion: fragments go to the GUI, whole sentences to TTS as they complete."""
+        client = self._openai_client(self.config_mgr.get("api_keys.openai", ""))
+        started = False
+        full, pending = [], ""
         try:
-            response = openai.ChatCompletion.create(
+            response = client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": "You are a concise, friendly assistant for an elderly user. Keep replies short and clear."},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.6,
-                max_tokens=200
+                max_tokens=200,
+                stream=True
             )
-            text = response.choices[0].message.content.strip()
-            return text
+            for chunk in response:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                if not started:
+                    delta = delta.lstrip()
+                    started = True
+                full.append(delta)
+                self.gui_queue.append(("append_chunk", "assistant", delta))
+                *sentences, pending = SENTENCE_END_RE.split(pending + delta)
+                for sentence in sentences:
+                    self.speak(sentence)
+            if pending.strip():
+                self.speak(pending.strip())
+            return "".join(full).strip()
         except Exception as e:
             print(f"[OpenAI] error: {e}")
-            raise
+            if not full:
+                raise  # nothing shown yet; the caller falls back to Wikipedia
+            # cut off mid-reply: keep what the user already saw and heard instead of a second answer
+            if pending.strip():
+                self.speak(pending.strip())
+            return "".join(full).strip()
+        finally:
+            if started:
+                self.gui_queue.append(("append_end", "assistant"))
 
     # -------------------------
     # WEATHER / NEWS / JOKE
     # -------------------------
+    def _cache_get(self, cache: Dict[str, tuple], key: str) -> Optional[str]:
+        with self._cache_lock:
+            expires, val = cache.get(key, (0.0, None))
+        if time.time() < expires:
+            return val
+        return None
+
+    def _cache_put(self, cache: Dict[str, tuple], key: str, val: str, ttl: int):
+        expires = time.time() + ttl + random.uniform(-CACHE_JITTER, CACHE_JITTER)
+        with self._cache_lock:
+            cache[key] = (expires, val)
+
     def get_weather(self) -> str:
         api_key = self.config_mgr.get("api_keys.openweathermap", "")
         city = self.config.get("city", "New York")
         if not api_key:
             return "Weather API key not configured. Please add it in Settings."
+        key = city.lower()
+        cached = self._cache_get(self._weather_cache, key)
+        if cached is not None:
+            return cached
         try:
             params = {"q": city, "appid": api_key, "units": "metric"}
-            r = requests.get(WEATHER_URL, params=params, timeout=8)
+            r = self.http.get(WEATHER_URL, params=params, timeout=8)
             r.raise_for_status()
-            data = r.json()
+            data = json_loads(r.content)
             temp = data["main"]["temp"]
             desc = data["weather"][0]["description"].capitalize()
             feels = data["main"].get("feels_like")
-            return f"The weather in {city} is {desc}, {temp}°C (feels like {feels}°C)."
+            result = f"The weather in {city} is {desc}, {temp}°C (feels like {feels}°C)."
+            self._cache_put(self._weather_cache, key, result, WEATHER_TTL)
+            return result
         except Exception as e:
             return f"Could not fetch weather: {e}"
 
@@ -545,25 +929,26 @@ class AURAApp(ctk.CTk):
         api_key = self.config_mgr.get("api_keys.newsapi", "")
         if not api_key:
             return "News API key not configured. Please add it in Settings."
+        country = "us"
+        cached = self._cache_get(self._news_cache, country)
+        if cached is not None:
+            return cached
         try:
-            params = {"country": "us", "apiKey": api_key, "pageSize": 3}
-            r = requests.get(NEWS_URL, params=params, timeout=8)
+            params = {"country": country, "apiKey": api_key, "pageSize": 3}
+            r = self.http.get(NEWS_URL, params=params, timeout=8)
             r.raise_for_status()
-            articles = r.json().get("articles", [])
+            articles = json_loads(r.content).get("articles", [])
             if not articles:
                 return "No headlines available right now."
             headlines = [f"{i+1}. {a.get('title','No title')}" for i, a in enumerate(articles)]
-            return "Top headlines:\n" + "\n".join(headlines)
+            result = "Top headlines:\n" + "\n".join(headlines)
+            self._cache_put(self._news_cache, country, result, NEWS_TTL)
+            return result
         except Exception as e:
             return f"Could not fetch news: {e}"
 
     def get_joke(self) -> str:
-        jokes = [
-            "Why don't scientists trust atoms? Because they make up everything.",
-            "I told my wife she drew her eyebrows too high. She looked surprised.",
-            "What do you call a fake noodle? An impasta!"
-        ]
-        return random.choice(jokes)
+        return random.choice(JOKES)
 
     # -------------------------
     # MUSIC
@@ -578,86 +963,138 @@ class AURAApp(ctk.CTk):
                 self.config_mgr.set("favorites.music", music_files)
                 self.config_mgr.save()
             else:
-                self.gui_queue.put(("append", "assistant", "No music files configured."))
+                self.gui_queue.append(("append", "assistant", "No music files configured."))
                 return
         try:
             choice = random.choice(music_files)
-            mixer.music.load(choice)
-            mixer.music.play()
-            self.gui_queue.put(("append", "assistant", f"Now playing: {os.path.basename(choice)}"))
+            player = get_mixer()
+            player.stop()
+            player.music.stop()
+            sound = self._sound_cache.get(choice)
+            if sound is not None:
+                sound.play()
+            else:
+                # not preloaded (too large, over budget, or added since): stream from disk
+                player.music.load(choice)
+                player.music.play()
+            self.gui_queue.append(("append", "assistant", f"Now playing: {os.path.basename(choice)}"))
         except Exception as e:
-            self.gui_queue.put(("append", "assistant", f"Could not play music: {e}"))
+            self.gui_queue.append(("append", "assistant", f"Could not play music: {e}"))
+
+    def _start_music_preload(self):
+        files = list(self.config_mgr.get("favorites.music", []) or [])
+        if not files:
+            self._sound_cache = {}  # nothing to decode, and no reason to start the mixer
+            return
+        threading.Thread(target=self._preload_music, args=(files,), daemon=True).start()
+
+    def _preload_music(self, files: List[str]):
+        player = get_mixer()
+        try:
+            freq, fmt, channels = player.get_init()
+            bytes_per_sec = freq * channels * (abs(fmt) // 8)
+        except Exception:
+            return  # mixer not available; play_music_from_favorites reports the error
+        old = self._sound_cache
+        cache = {}
+        used = 0
+        for path in files:
+            try:
+                sound = old.get(path)  # already decoded by an earlier preload
+                if sound is None:
+                    if not os.path.exists(path):
+                        continue
+                    size = os.path.getsize(path)
+                    # decoded audio is never smaller than the file, so skip what can't fit
+                    if size > SOUND_CACHE_MAX_BYTES or used + size > SOUND_CACHE_BUDGET_BYTES:
+                        continue
+                    sound = player.Sound(path)
+                decoded = int(sound.get_length() * bytes_per_sec)
+                if used + decoded <= SOUND_CACHE_BUDGET_BYTES:
+                    cache[path] = sound
+                    used += decoded
+            except Exception as e:
+                print(f"[Audio] could not preload {path}: {e}")
+        self._sound_cache = cache
 
     # -------------------------
     # REMINDERS / MEDICATION
     # -------------------------
     def _schedule_medication_reminders(self):
-        # cancel previously scheduled after jobs (best effort)
-        for after_id in list(self._med_after_ids):
+        # cancel the outstanding timer (best effort)
+        if self._next_med_after_id is not None:
             try:
-                self.after_cancel(after_id)
+                self.after_cancel(self._next_med_after_id)
             except Exception:
                 pass
-        self._med_after_ids.clear()
+            self._next_med_after_id = None
 
         schedule = self.config_mgr.get("medication_schedule", {}) or {}
-        now = datetime.datetime.now()
+        now = time.localtime()
+        now_epoch = time.time()
+        heap = []
         for med, times in schedule.items():
             for tstr in times:
                 try:
                     hh, mm = [int(x) for x in tstr.strip().split(":")]
-                    next_dt = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
-                    if next_dt <= now:
-                        next_dt += datetime.timedelta(days=1)
-                    delta = (next_dt - now).total_seconds()
-                    after_id = self.after(int(delta * 1000), lambda m=med, ts=tstr: self._trigger_medication(m, ts))
-                    self._med_after_ids.append(after_id)
+                    if not (0 <= hh < 24 and 0 <= mm < 60):
+                        raise ValueError("out of range")
+                    heap.append((now_epoch + seconds_until(hh, mm, now), med, tstr))
                 except Exception as e:
                     print(f"[Schedule] invalid time {tstr} for {med}: {e}")
+        heapq.heapify(heap)
+        self._med_heap = heap
+        self._arm_next_med()
+
+    def _arm_next_med(self):
+        if not self._med_heap:
+            self._next_med_after_id = None
+            return
+        delay_ms = max(0, int((self._med_heap[0][0] - time.time()) * 1000))
+        self._next_med_after_id = self.after(delay_ms, self._fire_next_med)
+
+    def _fire_next_med(self):
+        # fire everything that is due, reschedule each for the same time tomorrow
+        now = time.time()
+        while self._med_heap and self._med_heap[0][0] <= now + 0.5:
+            due, med, tstr = heapq.heappop(self._med_heap)
+            self._trigger_medication(med, tstr)
+            heapq.heappush(self._med_heap, (due + 24 * 3600, med, tstr))
+        self._arm_next_med()
 
     def _trigger_medication(self, med: str, time_str: str):
         msg = f"It's time to take your {med} ({time_str})."
-        self.gui_queue.put(("append", "assistant", msg))
+        self.gui_queue.append(("append", "assistant", msg))
         self.speak(msg, interrupt=True)
-        # reschedule for next day
-        # compute 24 hours in ms
-        after_id = self.after(24 * 3600 * 1000, lambda: self._trigger_medication(med, time_str))
-        self._med_after_ids.append(after_id)
 
     def show_medication_schedule(self):
         schedule = self.config_mgr.get("medication_schedule", {}) or {}
         if not schedule:
-            self.gui_queue.put(("append", "assistant", "You don't have any medications scheduled. Add them in Settings."))
+            self.gui_queue.append(("append", "assistant", "You don't have any medications scheduled. Add them in Settings."))
             return
         lines = ["Your medication schedule:"]
         for med, times in schedule.items():
             lines.append(f" - {med}: {', '.join(times)}")
         text = "\n".join(lines)
-        self.gui_queue.put(("append", "assistant", text))
+        self.gui_queue.append(("append", "assistant", text))
         return text
 
     def add_reminder(self, command_text: str) -> str:
         # Basic parsing for "remind me to <task> at HH:MM"
-        if "remind me to" in command_text:
-            part = command_text.split("remind me to", 1)[1].strip()
-            # try to detect time at end
-            words = part.rsplit(" at ", 1)
-            if len(words) == 2:
-                task, tstr = words[0].strip(), words[1].strip()
-                try:
-                    hh, mm = [int(x) for x in tstr.split(":")]
-                    now = datetime.datetime.now()
-                    remind_dt = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
-                    if remind_dt <= now:
-                        remind_dt += datetime.timedelta(days=1)
-                    delta = (remind_dt - now).total_seconds()
-                    self.after(int(delta * 1000), lambda: (self.gui_queue.put(("append", "assistant", f"Reminder: {task}")), self.speak(f"Reminder: {task}")))
-                    return f"Okay — I'll remind you to {task} at {tstr}."
-                except Exception:
-                    return "I couldn't parse the time. Use HH:MM format."
-            else:
-                return f"Okay — I'll remind you to {part} (but no time was given)."
-        return "Tell me what to remind you about using 'remind me to ... at HH:MM'."
+        m = REMIND_RE.search(command_text)
+        if not m:
+            return "Tell me what to remind you about using 'remind me to ... at HH:MM'."
+        task = m["task"]
+        if m["h"] is None:
+            if m["at"]:
+                return "I couldn't parse the time. Use HH:MM format."
+            return f"Okay — I'll remind you to {task} (but no time was given)."
+        hh, mm = int(m["h"]), int(m["m"])
+        if not (0 <= hh < 24 and 0 <= mm < 60):
+            return "I couldn't parse the time. Use HH:MM format."
+        delta = seconds_until(hh, mm)
+        self.after(delta * 1000, lambda: (self.gui_queue.append(("append", "assistant", f"Reminder: {task}")), self.speak(f"Reminder: {task}")))
+        return f"Okay — I'll remind you to {task} at {m['h']}:{m['m']}."
 
     # -------------------------
     # CONTACTS / EMERGENCY
@@ -665,17 +1102,17 @@ class AURAApp(ctk.CTk):
     def emergency_protocol(self):
         # Visual and audible alert + call simulation
         msg = "Emergency assistance requested! Contacting emergency contacts..."
-        self.gui_queue.put(("append", "emergency", msg))
+        self.gui_queue.append(("append", "emergency", msg))
         self.speak("Emergency! Assistance requested!", interrupt=True)
         # simulate calls or alerts
         contacts = self.config_mgr.get("emergency_contacts", []) or []
         if not contacts:
-            self.gui_queue.put(("append", "assistant", "No emergency contacts configured. Please add them in Settings."))
+            self.gui_queue.append(("append", "assistant", "No emergency contacts configured. Please add them in Settings."))
             return
         for c in contacts:
             name = c.get("name", "Unknown")
             phone = c.get("phone", "Unknown")
-            self.gui_queue.put(("append", "system", f"Simulating call to {name} ({phone})..."))
+            self.gui_queue.append(("append", "system", f"Simulating call to {name} ({phone})..."))
 
     # -------------------------
     # SETTINGS UI
@@ -698,19 +1135,17 @@ class AURAApp(ctk.CTk):
         self.font_size = new_font_size
         self.textbox.configure(font=ctk.CTkFont(size=self.font_size))
         self.entry.configure(font=ctk.CTkFont(size=self.font_size))
-        # tts
-        try:
-            tts_engine.setProperty("rate", int(self.config.get("voice_rate", 150)))
-            tts_engine.setProperty("volume", float(self.config.get("voice_volume", 1.0)))
-        except Exception:
-            pass
+        # tts (if not started yet, settings are applied on first use)
+        if tts_engine is not None:
+            try:
+                tts_engine.setProperty("rate", int(self.config.get("voice_rate", 150)))
+                tts_engine.setProperty("volume", float(self.config.get("voice_volume", 1.0)))
+            except Exception:
+                pass
         # update favorites etc
+        self._start_music_preload()
         # reschedule meds
         self._schedule_medication_reminders()
-        # openai key
-        openai_key = self.config_mgr.get("api_keys.openai", "")
-        if openai_key:
-            openai.api_key = openai_key
 
     # -------------------------
     # SHUTDOWN
@@ -719,13 +1154,24 @@ class AURAApp(ctk.CTk):
         # stop listening
         self.listening_event.clear()
         # stop TTS
-        try:
-            tts_engine.stop()
-        except Exception:
-            pass
+        self._tts_q.put(_TTS_STOP)
+        if tts_engine is not None:
+            try:
+                tts_engine.stop()
+            except Exception:
+                pass
         # stop mixer
+        if mixer is not None:
+            try:
+                mixer.stop()
+                mixer.music.stop()
+            except Exception:
+                pass
+        # close pooled HTTP connections
         try:
-            mixer.music.stop()
+            self.http.close()
+            if self._oa is not None:
+                self._oa.close()
         except Exception:
             pass
         # exit
@@ -735,10 +1181,68 @@ class AURAApp(ctk.CTk):
         except SystemExit:
             pass
 
+# -------------------------
+# SETTINGS: inline Treeview editing
+# -------------------------
+class TreeCellEditor:
+    """One reusable ttk.Entry overlaid on a Treeview cell; double-click a cell to edit it."""
+    def __init__(self, tree: ttk.Treeview):
+        self.tree = tree
+        self.entry = ttk.Entry(tree)
+        self._cell = None  # (row iid, column id) being edited
+        tree.bind("<Double-1>", self._on_double_click)
+        self.entry.bind("<Return>", lambda e: self.commit())
+        self.entry.bind("<FocusOut>", lambda e: self.commit())
+        self.entry.bind("<Escape>", lambda e: self.cancel())
+
+    def _on_double_click(self, event):
+        row, col = self.tree.identify_row(event.y), self.tree.identify_column(event.x)
+        if row and col:
+            self.edit(row, col)
+
+    def edit(self, row: str, col: str = "#1"):
+        self.commit()
+        self.tree.see(row)
+        bbox = self.tree.bbox(row, col)
+        if not bbox:
+            return
+        x, y, w, h = bbox
+        self._cell = (row, col)
+        self.entry.delete(0, "end")
+        self.entry.insert(0, self.tree.set(row, col))
+        self.entry.place(x=x, y=y, width=w, height=h)
+        self.entry.focus_set()
+        self.entry.select_range(0, "end")
+
+    def commit(self):
+        if self._cell is None:
+            return
+        row, col = self._cell
+        self._cell = None
+        if self.tree.exists(row):
+            self.tree.set(row, col, self.entry.get())
+        self.entry.place_forget()
+
+    def cancel(self):
+        self._cell = None
+        self.entry.place_forget()
+
 # -------------------------
 # SETTINGS DIALOG
 # -------------------------
 class SettingsDialog(ctk.CTkToplevel):
+    # (label, attribute, CTkEntry options)
+    _GENERAL_SPEC = [
+        ("User Name:", "user_name_entry", {}),
+        ("City (for weather):", "city_entry", {}),
+    ]
+    _API_SPEC = [
+        ("OpenWeatherMap Key:", "weather_key_entry", {"show": "*"}),
+        ("NewsAPI Key:", "news_key_entry", {"show": "*"}),
+        ("OpenAI Key:", "openai_key_entry", {"show": "*"}),
+    ]
+    _title_font = None  # created on first open, shared by every later one
+
     def __init__(self, parent: AURAApp, config_mgr: ConfigManager):
         super().__init__(parent)
         self.parent = parent
@@ -747,244 +1251,320 @@ class SettingsDialog(ctk.CTkToplevel):
         self.geometry("640x720")
         self.resizable(False, False)
         self.transient(parent)
-        self.grab_set()
 
+        # build and fill while hidden so the widgets are painted once, not one at a time
+        self.withdraw()
         self._build_ui()
-        self._load_values()
+        self._ensure_tab(self.tabview.get())
+        self.update_idletasks()
+        self.deiconify()
+        self.lift()
+        self.focus_force()
+        self.grab_set()  # needs a viewable window
 
     def _build_ui(self):
         self.grid_columnconfigure(0, weight=1)
 
-        title = ctk.CTkLabel(self, text="Settings", font=ctk.CTkFont(size=20, weight="bold"))
+        if SettingsDialog._title_font is None:
+            SettingsDialog._title_font = ctk.CTkFont(size=20, weight="bold")
+        title = ctk.CTkLabel(self, text="Settings", font=SettingsDialog._title_font)
         title.grid(row=0, column=0, padx=16, pady=(12, 6), sticky="w")
 
-        # Tabview
-        self.tabview = ctk.CTkTabview(self, width=600)
+        # Tabview: tab contents are built the first time each tab is shown
+        self._tab_builders = {
+            "General": (self._build_general, self._load_general),
+            "API Keys": (self._build_api, self._load_api),
+            "Contacts": (self._build_contacts, self._load_contacts),
+            "Medication": (self._build_meds, self._load_meds),
+            "Favorites": (self._build_favorites, self._load_favorites),
+        }
+        self._built = {t: False for t in self._tab_builders}
+        self.tabview = ctk.CTkTabview(self, width=600, command=self._on_tab_changed)
         self.tabview.grid(row=1, column=0, padx=16, pady=8, sticky="nsew")
-        for t in ("General", "API Keys", "Contacts", "Medication", "Favorites"):
+        for t in self._tab_builders:
             self.tabview.add(t)
 
-        # General tab
-        g = self.tabview.tab("General")
-        g.grid_columnconfigure(1, weight=1)
-        ctk.CTkLabel(g, text="User Name:").grid(row=0, column=0, padx=8, pady=8, sticky="w")
-        self.user_name_entry = ctk.CTkEntry(g)
-        self.user_name_entry.grid(row=0, column=1, padx=8, pady=8, sticky="ew")
+        # Save/Cancel
+        button_frame = ctk.CTkFrame(self)
+        button_frame.grid(row=2, column=0, padx=16, pady=12, sticky="ew")
+        button_frame.grid_columnconfigure((0,1), weight=1)
+        save_btn = ctk.CTkButton(button_frame, text="Save & Apply", command=self.save_settings)
+        save_btn.grid(row=0, column=0, padx=6, sticky="ew")
+        cancel_btn = ctk.CTkButton(button_frame, text="Cancel", fg_color="#D35B58", hover_color="#a34643", command=self.cancel)
+        cancel_btn.grid(row=0, column=1, padx=6, sticky="ew")
 
-        ctk.CTkLabel(g, text="City (for weather):").grid(row=1, column=0, padx=8, pady=8, sticky="w")
-        self.city_entry = ctk.CTkEntry(g)
-        self.city_entry.grid(row=1, column=1, padx=8, pady=8, sticky="ew")
+    def _on_tab_changed(self):
+        self._ensure_tab(self.tabview.get())
 
-        ctk.CTkLabel(g, text="Theme:").grid(row=2, column=0, padx=8, pady=8, sticky="w")
+    def _ensure_tab(self, name: str):
+        if self._built[name]:
+            return
+        build, load = self._tab_builders[name]
+        build(self.tabview.tab(name))
+        load()
+        self._built[name] = True
+
+    def _build_entry_rows(self, parent, spec, start_row: int = 0) -> int:
+        """Label + entry per spec row, stored as self.<attr>; returns the next free grid row."""
+        for row, (label, attr, opts) in enumerate(spec, start=start_row):
+            ctk.CTkLabel(parent, text=label).grid(row=row, column=0, padx=8, pady=8, sticky="w")
+            entry = ctk.CTkEntry(parent, **opts)
+            entry.grid(row=row, column=1, padx=8, pady=8, sticky="ew")
+            setattr(self, attr, entry)
+        return start_row + len(spec)
+
+    def _build_general(self, g):
+        self._last_font_text = self._last_rate_text = self._last_vol_text = None
+        g.grid_columnconfigure(1, weight=1)
+        row = self._build_entry_rows(g, self._GENERAL_SPEC)
+
+        ctk.CTkLabel(g, text="Theme:").grid(row=row, column=0, padx=8, pady=8, sticky="w")
         self.theme_var = ctk.StringVar(value=self.config_mgr.get("theme", "Dark"))
         self.theme_menu = ctk.CTkOptionMenu(g, values=["Dark", "Light", "System"], variable=self.theme_var)
-        self.theme_menu.grid(row=2, column=1, padx=8, pady=8, sticky="w")
-
-        ctk.CTkLabel(g, text="Font Size:").grid(row=3, column=0, padx=8, pady=8, sticky="w")
-        self.font_slider = ctk.CTkSlider(g, from_=12, to=24, number_of_steps=12, command=self._update_font_label)
-        self.font_slider.grid(row=3, column=1, padx=8, pady=8, sticky="ew")
+        self.theme_menu.grid(row=row, column=1, padx=8, pady=8, sticky="w")
+
+        # sliders are bound to Tk variables, so IntVar does the rounding for font size / rate
+        row += 1
+        ctk.CTkLabel(g, text="Font Size:").grid(row=row, column=0, padx=8, pady=8, sticky="w")
+        self.font_var = tk.IntVar(self, value=12)
+        self.font_slider = ctk.CTkSlider(g, from_=12, to=24, number_of_steps=12, variable=self.font_var, command=self._update_font_label)
+        self.font_slider.grid(row=row, column=1, padx=8, pady=8, sticky="ew")
         self.font_label = ctk.CTkLabel(g, text="")
-        self.font_label.grid(row=3, column=2, padx=8, pady=8, sticky="w")
+        self.font_label.grid(row=row, column=2, padx=8, pady=8, sticky="w")
 
-        ctk.CTkLabel(g, text="Voice Rate:").grid(row=4, column=0, padx=8, pady=8, sticky="w")
-        self.rate_slider = ctk.CTkSlider(g, from_=80, to=240, number_of_steps=160, command=self._update_rate_label)
-        self.rate_slider.grid(row=4, column=1, padx=8, pady=8, sticky="ew")
+        row += 1
+        ctk.CTkLabel(g, text="Voice Rate:").grid(row=row, column=0, padx=8, pady=8, sticky="w")
+        self.rate_var = tk.IntVar(self, value=80)
+        self.rate_slider = ctk.CTkSlider(g, from_=80, to=240, number_of_steps=16, variable=self.rate_var, command=self._update_rate_label)
+        self.rate_slider.grid(row=row, column=1, padx=8, pady=8, sticky="ew")
         self.rate_label = ctk.CTkLabel(g, text="")
-        self.rate_label.grid(row=4, column=2, padx=8, pady=8, sticky="w")
+        self.rate_label.grid(row=row, column=2, padx=8, pady=8, sticky="w")
 
-        ctk.CTkLabel(g, text="Voice Volume:").grid(row=5, column=0, padx=8, pady=8, sticky="w")
-        self.volume_slider = ctk.CTkSlider(g, from_=0.0, to=1.0, number_of_steps=10, command=self._update_volume_label)
-        self.volume_slider.grid(row=5, column=1, padx=8, pady=8, sticky="ew")
+        row += 1
+        ctk.CTkLabel(g, text="Voice Volume:").grid(row=row, column=0, padx=8, pady=8, sticky="w")
+        self.vol_var = tk.DoubleVar(self, value=0.0)
+        self.volume_slider = ctk.CTkSlider(g, from_=0.0, to=1.0, number_of_steps=10, variable=self.vol_var, command=self._update_volume_label)
+        self.volume_slider.grid(row=row, column=1, padx=8, pady=8, sticky="ew")
         self.vol_label = ctk.CTkLabel(g, text="")
-        self.vol_label.grid(row=5, column=2, padx=8, pady=8, sticky="w")
+        self.vol_label.grid(row=row, column=2, padx=8, pady=8, sticky="w")
 
-        # API Keys tab
-        a = self.tabview.tab("API Keys")
+    def _build_api(self, a):
         a.grid_columnconfigure(1, weight=1)
-        ctk.CTkLabel(a, text="OpenWeatherMap Key:").grid(row=0, column=0, padx=8, pady=8, sticky="w")
-        self.weather_key_entry = ctk.CTkEntry(a, show="*")
-        self.weather_key_entry.grid(row=0, column=1, padx=8, pady=8, sticky="ew")
-
-        ctk.CTkLabel(a, text="NewsAPI Key:").grid(row=1, column=0, padx=8, pady=8, sticky="w")
-        self.news_key_entry = ctk.CTkEntry(a, show="*")
-        self.news_key_entry.grid(row=1, column=1, padx=8, pady=8, sticky="ew")
-
-        ctk.CTkLabel(a, text="OpenAI Key:").grid(row=2, column=0, padx=8, pady=8, sticky="w")
-        self.openai_key_entry = ctk.CTkEntry(a, show="*")
-        self.openai_key_entry.grid(row=2, column=1, padx=8, pady=8, sticky="ew")
-
-        # Contacts tab
-        ctab = self.tabview.tab("Contacts")
-        ctab.grid_rowconfigure(0, weight=1)
-        ctab.grid_columnconfigure(0, weight=1)
-        self.contacts_frame = ctk.CTkScrollableFrame(ctab, label_text="Emergency Contacts")
-        self.contacts_frame.grid(row=0, column=0, padx=8, pady=8, sticky="nsew")
-        self.contact_widgets = []  # list of dicts {frame, name_entry, relation_entry, phone_entry}
-        add_contact_btn = ctk.CTkButton(ctab, text="+ Add Contact", command=self._add_contact_widget)
-        add_contact_btn.grid(row=1, column=0, padx=8, pady=8, sticky="ew")
-
-        # Medication tab
-        mtab = self.tabview.tab("Medication")
-        mtab.grid_rowconfigure(0, weight=1)
-        mtab.grid_columnconfigure(0, weight=1)
-        self.med_frame = ctk.CTkScrollableFrame(mtab, label_text="Medication Schedule (HH:MM comma-separated)")
-        self.med_frame.grid(row=0, column=0, padx=8, pady=8, sticky="nsew")
-        self.med_widgets = []
-        add_med_btn = ctk.CTkButton(mtab, text="+ Add Medication", command=self._add_med_widget)
-        add_med_btn.grid(row=1, column=0, padx=8, pady=8, sticky="ew")
-
-        # Favorites tab
-        ftab = self.tabview.tab("Favorites")
+        self._build_entry_rows(a, self._API_SPEC)
+
+    def _build_record_tab(self, tab, label: str, columns: tuple, add_text: str):
+        """Label + Treeview (one row per record) + Add/Remove buttons; returns (tree, editor)."""
+        tab.grid_rowconfigure(1, weight=1)
+        tab.grid_columnconfigure(0, weight=1)
+        ctk.CTkLabel(tab, text=label).grid(row=0, column=0, columnspan=2, padx=8, pady=(8, 0), sticky="w")
+        tree = ttk.Treeview(tab, columns=[c for c, _ in columns], show="headings", selectmode="extended")
+        for col, heading in columns:
+            tree.heading(col, text=heading)
+            tree.column(col, width=120, stretch=True)
+        tree.grid(row=1, column=0, padx=(8, 0), pady=8, sticky="nsew")
+        vsb = ttk.Scrollbar(tab, orient="vertical", command=tree.yview)
+        vsb.grid(row=1, column=1, padx=(0, 8), pady=8, sticky="ns")
+        tree.configure(yscrollcommand=vsb.set)
+        editor = TreeCellEditor(tree)
+
+        # removed rows are detached and kept for reuse rather than deleted and recreated
+        pool: List[str] = []
+        blank = ("",) * len(columns)
+
+        def add_row():
+            if pool:
+                row = pool.pop()
+                tree.item(row, values=blank)
+                tree.move(row, "", "end")
+            else:
+                row = tree.insert("", "end", values=blank)
+            tree.after_idle(lambda: editor.edit(row))
+
+        def remove_selected():
+            editor.cancel()
+            sel = tree.selection()
+            if sel:
+                tree.selection_remove(*sel)
+                tree.detach(*sel)
+                pool.extend(sel)
+
+        tree.bind("<Delete>", lambda e: remove_selected())
+        btns = ctk.CTkFrame(tab, fg_color="transparent")
+        btns.grid(row=2, column=0, columnspan=2, padx=8, pady=8, sticky="ew")
+        btns.grid_columnconfigure((0, 1), weight=1)
+        ctk.CTkButton(btns, text=add_text, command=add_row).grid(row=0, column=0, padx=(0, 4), sticky="ew")
+        ctk.CTkButton(btns, text="− Remove Selected", command=remove_selected).grid(row=0, column=1, padx=(4, 0), sticky="ew")
+        return tree, editor
+
+    def _build_contacts(self, ctab):
+        self.contacts_tree, self._contacts_editor = self._build_record_tab(
+            ctab, "Emergency Contacts (double-click a cell to edit)",
+            (("name", "Name"), ("relation", "Relation"), ("phone", "Phone")), "+ Add Contact")
+
+    def _build_meds(self, mtab):
+        self.med_tree, self._med_editor = self._build_record_tab(
+            mtab, "Medication Schedule (HH:MM comma-separated)",
+            (("name", "Medication Name"), ("times", "Times (HH:MM, comma-separated)")), "+ Add Medication")
+
+    def _build_favorites(self, ftab):
         ftab.grid_columnconfigure(0, weight=1)
         ctk.CTkLabel(ftab, text="Favorite Music Files (one per line)").grid(row=0, column=0, padx=8, pady=8, sticky="w")
         self.music_text = ctk.CTkTextbox(ftab, height=160)
         self.music_text.grid(row=1, column=0, padx=8, pady=8, sticky="ew")
+        self.music_text.bind("<<Modified>>", self._on_music_modified)
         add_music_btn = ctk.CTkButton(ftab, text="Add Files...", command=self._add_music_files)
         add_music_btn.grid(row=2, column=0, padx=8, pady=8, sticky="w")
 
-        # Save/Cancel
-        button_frame = ctk.CTkFrame(self)
-        button_frame.grid(row=2, column=0, padx=16, pady=12, sticky="ew")
-        button_frame.grid_columnconfigure((0,1), weight=1)
-        save_btn = ctk.CTkButton(button_frame, text="Save & Apply", command=self.save_settings)
-        save_btn.grid(row=0, column=0, padx=6, sticky="ew")
-        cancel_btn = ctk.CTkButton(button_frame, text="Cancel", fg_color="#D35B58", hover_color="#a34643", command=self.cancel)
-        cancel_btn.grid(row=0, column=1, padx=6, sticky="ew")
-
-    def _update_font_label(self, v):
-        self.font_label.configure(text=str(int(float(v))))
-
-    def _update_rate_label(self, v):
-        self.rate_label.configure(text=str(int(float(v))))
-
-    def _update_volume_label(self, v):
-        self.vol_label.configure(text=f"{float(v):.2f}")
-
-    def _load_values(self):
+    # slider callbacks fire on every drag step; only touch the label when its text changes
+    def _update_font_label(self, v=None):
+        t = str(self.font_var.get())
+        if t != self._last_font_text:
+            self._last_font_text = t
+            self.font_label.configure(text=t)
+
+    def _update_rate_label(self, v=None):
+        t = str(self.rate_var.get())
+        if t != self._last_rate_text:
+            self._last_rate_text = t
+            self.rate_label.configure(text=t)
+
+    def _update_volume_label(self, v=None):
+        t = f"{self.vol_var.get():.2f}"
+        if t != self._last_vol_text:
+            self._last_vol_text = t
+            self.vol_label.configure(text=t)
+
+    def _load_general(self):
         cfg = self.config_mgr.data
-        # General
         self.user_name_entry.insert(0, cfg.get("user_name", "User"))
         self.city_entry.insert(0, cfg.get("city", "New York"))
         self.theme_var.set(cfg.get("theme", "Dark"))
-        self.font_slider.set(cfg.get("font_size", 16))
-        self._update_font_label(self.font_slider.get())
-        self.rate_slider.set(cfg.get("voice_rate", 150))
-        self._update_rate_label(self.rate_slider.get())
-        self.volume_slider.set(cfg.get("voice_volume", 1.0))
-        self._update_volume_label(self.volume_slider.get())
-
-        # API Keys
-        apis = cfg.get("api_keys", {})
+        self.font_var.set(int(cfg.get("font_size", 16)))
+        self._update_font_label()
+        self.rate_var.set(int(cfg.get("voice_rate", 150)))
+        self._update_rate_label()
+        self.vol_var.set(float(cfg.get("voice_volume", 1.0)))
+        self._update_volume_label()
+
+    def _load_api(self):
+        apis = self.config_mgr.data.get("api_keys", {})
         self.weather_key_entry.insert(0, apis.get("openweathermap", ""))
         self.news_key_entry.insert(0, apis.get("newsapi", ""))
         self.openai_key_entry.insert(0, apis.get("openai", ""))
 
-        # Contacts
-        for c in cfg.get("emergency_contacts", []):
-            self._add_contact_widget(c)
+    def _load_contacts(self):
+        for c in self.config_mgr.data.get("emergency_contacts", []):
+            self.contacts_tree.insert("", "end", values=(c.get("name", ""), c.get("relation", ""), c.get("phone", "")))
 
-        # Medication
-        for med, times in cfg.get("medication_schedule", {}).items():
-            self._add_med_widget(med, ", ".join(times))
+    def _load_meds(self):
+        for med, times in self.config_mgr.data.get("medication_schedule", {}).items():
+            # shown as stored, so an invalid time is fixed by the user rather than silently lost
+            self.med_tree.insert("", "end", values=(med, ", ".join(times)))
 
-        # Favorites
-        music = cfg.get("favorites", {}).get("music", [])
+    def _load_favorites(self):
+        music = self.config_mgr.data.get("favorites", {}).get("music", [])
+        self._music_set = set(music)
+        self._music_list_cached = sorted(self._music_set)
         self.music_text.insert("1.0", "\n".join(music))
+        self._music_clean()
 
-    def _add_contact_widget(self, contact: Optional[Dict] = None):
-        frame = ctk.CTkFrame(self.contacts_frame)
-        frame.grid(padx=6, pady=6, sticky="ew")
-        frame.grid_columnconfigure((0,1,2), weight=1)
-        name_entry = ctk.CTkEntry(frame, placeholder_text="Name")
-        name_entry.grid(row=0, column=0, padx=6, pady=6, sticky="ew")
-        rel_entry = ctk.CTkEntry(frame, placeholder_text="Relation")
-        rel_entry.grid(row=0, column=1, padx=6, pady=6, sticky="ew")
-        phone_entry = ctk.CTkEntry(frame, placeholder_text="Phone")
-        phone_entry.grid(row=0, column=2, padx=6, pady=6, sticky="ew")
-        remove = ctk.CTkButton(frame, text="×", width=36, command=lambda f=frame: self._remove_contact_widget(f))
-        remove.grid(row=0, column=3, padx=6, pady=6)
-        if contact:
-            name_entry.insert(0, contact.get("name", ""))
-            rel_entry.insert(0, contact.get("relation", ""))
-            phone_entry.insert(0, contact.get("phone", ""))
-        self.contact_widgets.append({"frame": frame, "name": name_entry, "relation": rel_entry, "phone": phone_entry})
-
-    def _remove_contact_widget(self, frame):
-        for i, w in enumerate(self.contact_widgets):
-            if w["frame"] == frame:
-                w["frame"].destroy()
-                self.contact_widgets.pop(i)
-                return
+    def _music_clean(self):
+        # our own inserts keep the cache in sync, so they don't count as user edits
+        self.music_text.edit_modified(False)
+        self._music_dirty_flag = False
 
-    def _add_med_widget(self, name: Optional[str] = None, times: Optional[str] = None):
-        frame = ctk.CTkFrame(self.med_frame)
-        frame.grid(padx=6, pady=6, sticky="ew")
-        frame.grid_columnconfigure(0, weight=1)
-        name_entry = ctk.CTkEntry(frame, placeholder_text="Medication Name")
-        name_entry.grid(row=0, column=0, padx=6, pady=6, sticky="ew")
-        times_entry = ctk.CTkEntry(frame, placeholder_text="Times (HH:MM, comma-separated)")
-        times_entry.grid(row=1, column=0, padx=6, pady=6, sticky="ew")
-        remove = ctk.CTkButton(frame, text="×", width=36, command=lambda f=frame: self._remove_med_widget(f))
-        remove.grid(row=0, column=1, rowspan=2, padx=6, pady=6)
-        if name:
-            name_entry.insert(0, name)
-        if times:
-            times_entry.insert(0, times)
-        self.med_widgets.append({"frame": frame, "name": name_entry, "times": times_entry})
-
-    def _remove_med_widget(self, frame):
-        for i, w in enumerate(self.med_widgets):
-            if w["frame"] == frame:
-                w["frame"].destroy()
-                self.med_widgets.pop(i)
-                return
+    def _on_music_modified(self, event=None):
+        if self.music_text.edit_modified():
+            self._music_dirty_flag = True
+            self.music_text.edit_modified(False)
+
+    def _reparse_music(self):
+        self._music_set = {line.strip() for line in self.music_text.get("1.0", "end-1c").splitlines() if line.strip()}
+        self._music_list_cached = sorted(self._music_set)
+        self._music_dirty_flag = False
 
     def _add_music_files(self):
         files = filedialog.askopenfilenames(title="Select music files", filetypes=[("Audio", "*.mp3 *.wav *.ogg")])
-        if files:
-            cur = set(line.strip() for line in self.music_text.get("1.0", "end-1c").splitlines() if line.strip())
-            cur.update(files)
-            self.music_text.delete("1.0", "end")
-            self.music_text.insert("1.0", "\n".join(sorted(cur)))
+        if self._music_dirty_flag:
+            self._reparse_music()  # the user edited the box by hand
+        new = [f for f in files if f not in self._music_set]
+        if new:
+            self._music_set.update(new)
+            self._music_list_cached = None  # sorted once, on save
+            # append only the new paths
+            last = self.music_text.get("end-2c", "end-1c")
+            sep = "\n" if last and last != "\n" else ""
+            self.music_text.insert("end", sep + "\n".join(new))
+            self._music_clean()
 
     def save_settings(self):
         try:
+            # tabs that were never opened keep their current config values
+            cfg = self.config_mgr.data
+            new_cfg: Dict = {}
             # General
-            self.config_mgr.set("user_name", self.user_name_entry.get().strip() or DEFAULT_CONFIG["user_name"])
-            self.config_mgr.set("city", self.city_entry.get().strip() or DEFAULT_CONFIG["city"])
-            self.config_mgr.set("theme", self.theme_var.get() or DEFAULT_CONFIG["theme"])
-            self.config_mgr.set("font_size", int(float(self.font_slider.get())))
-            self.config_mgr.set("voice_rate", int(float(self.rate_slider.get())))
-            self.config_mgr.set("voice_volume", float(self.volume_slider.get()))
+            if self._built["General"]:
+                new_cfg.update({
+                    "user_name": self.user_name_entry.get().strip() or _DEF_NAME,
+                    "city": self.city_entry.get().strip() or _DEF_CITY,
+                    "theme": self.theme_var.get() or _DEF_THEME,
+                    "font_size": self.font_var.get(),
+                    "voice_rate": self.rate_var.get(),
+                    "voice_volume": self.vol_var.get(),
+                })
 
             # Api keys
-            self.config_mgr.set("api_keys.openweathermap", self.weather_key_entry.get().strip())
-            self.config_mgr.set("api_keys.newsapi", self.news_key_entry.get().strip())
-            self.config_mgr.set("api_keys.openai", self.openai_key_entry.get().strip())
+            if self._built["API Keys"]:
+                new_cfg["api_keys"] = {
+                    **cfg.get("api_keys", {}),
+                    "openweathermap": self.weather_key_entry.get().strip(),
+                    "newsapi": self.news_key_entry.get().strip(),
+                    "openai": self.openai_key_entry.get().strip(),
+                }
 
             # Contacts
-            contacts = []
-            for w in self.contact_widgets:
-                name = w["name"].get().strip()
-                phone = w["phone"].get().strip()
-                relation = w["relation"].get().strip()
-                if name and phone:
-                    contacts.append({"name": name, "phone": phone, "relation": relation})
-            self.config_mgr.set("emergency_contacts", contacts)
+            if self._built["Contacts"]:
+                self._contacts_editor.commit()
+                rows = (self.contacts_tree.set(row) for row in self.contacts_tree.get_children())
+                new_cfg["emergency_contacts"] = [
+                    {"name": name, "phone": phone, "relation": relation}
+                    for vals in rows
+                    for name, phone, relation in [(vals["name"].strip(), vals["phone"].strip(), vals["relation"].strip())]
+                    if name and phone
+                ]
 
             # Medication
-            meds = {}
-            for w in self.med_widgets:
-                name = w["name"].get().strip()
-                times_raw = w["times"].get().strip()
-                if name and times_raw:
-                    times = [t.strip() for t in times_raw.split(",") if t.strip()]
-                    meds[name] = times
-            self.config_mgr.set("medication_schedule", meds)
+            if self._built["Medication"]:
+                self._med_editor.commit()
+                meds, bad = {}, []
+                for row in self.med_tree.get_children():
+                    vals = self.med_tree.set(row)
+                    name = vals["name"].strip()
+                    times = [t.strip() for t in vals["times"].split(",") if t.strip()]
+                    if not name and not times:
+                        continue  # blank row
+                    if name and times and all(TIMES_RE.fullmatch(t) for t in times):
+                        meds[name] = times
+                    else:
+                        bad.append(name or "(unnamed)")
+                if bad:
+                    # refuse to save rather than drop someone's reminders
+                    self.tabview.set("Medication")
+                    messagebox.showerror("Medication",
+                                         "Use HH:MM times separated by commas (e.g. 08:00, 20:30) for: " + ", ".join(bad),
+                                         parent=self)
+                    return
+                new_cfg["medication_schedule"] = meds
 
             # Favorites
-            music_lines = [line.strip() for line in self.music_text.get("1.0", "end-1c").splitlines() if line.strip()]
-            self.config_mgr.set("favorites.music", music_lines)
+            if self._built["Favorites"]:
+                if self._music_dirty_flag:
+                    self._reparse_music()
+                elif self._music_list_cached is None:
+                    self._music_list_cached = sorted(self._music_set)
+                new_cfg["favorites"] = {**cfg.get("favorites", {}), "music": self._music_list_cached}
+
+            self.config_mgr.update(new_cfg)
 
             # Save to file
             ok = self.config_mgr.save()
@@ -1,30 +1,49 @@
+import sys
+
 import pyttsx3
 
-print("Attempting to initialize the speech engine...")
+_ENGINE = None
+
+
+def get_engine():
+    """Return the shared speech engine, initializing it on first use."""
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = pyttsx3.init()
+    return _ENGINE
+
+
+def _init_and_speak(verbose=False):
+    try:
+        # Initialize the engine
+        engine = get_engine()
+        print("Engine initialized successfully.")
+
+        # Check properties (each is a driver round-trip, so only on request)
+        if verbose:
+            rate = engine.getProperty('rate')
+            volume = engine.getProperty('volume')
+            print(f"Current speech rate: {rate}")
+            print(f"Current volume level: {volume}")
 
-try:
-    # Initialize the engine
-    engine = pyttsx3.init()
-    print("Engine initialized successfully.")
+        # The text to speak
+        text_to_say = "If you can hear this message, the text to speech engine is working correctly."
+        print(f"Attempting to speak: '{text_to_say}'")
 
-    # Check properties
-    rate = engine.getProperty('rate')
-    volume = engine.getProperty('volume')
-    print(f"Current speech rate: {rate}")
-    print(f"Current volume level: {volume}")
+        # Queue the text and run the speech command
+        engine.say(text_to_say)
+        engine.runAndWait()
 
-    # The text to speak
-    text_to_say = "If you can hear this message, the text to speech engine is working correctly."
-    print(f"Attempting to speak: '{text_to_say}'")
+        print("Speech test finished.")
 
-    # Queue the text and run the speech command
-    engine.say(text_to_say)
-    engine.runAndWait()
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        print("\nTroubleshooting:")
+        print("- Make sure you have audio drivers installed.")
+        print("- On some systems, you may need to install espeak or nsss.")
 
-    print("Speech test finished.")
 
-except Exception as e:
-    print(f"An error occurred: {e}")
-    print("\nTroubleshooting:")
-    print("- Make sure you have audio drivers installed.")
-    print("- On some systems, you may need to install espeak or nsss.")
\ No newline at end of file
+if __name__ == "__main__":
+    print("Attempting to initialize the speech engine...")
+    # main thread on purpose: some drivers (nsss on macOS) must run there
+    _init_and_speak("--verbose" in sys.argv)